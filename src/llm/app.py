@@ -3,8 +3,9 @@
 # Copyright The OpenTelemetry Authors
 # SPDX-License-Identifier: Apache-2.0
 
-from flask import Flask, request, jsonify, Response
+from flask import Flask, request, Response, abort
 import json
+import orjson
 import time
 import random
 import re
@@ -16,6 +17,8 @@ from openfeature.contrib.provider.flagd import FlagdProvider
 
 app = Flask(__name__)
 app.logger.setLevel(logging.INFO)
+# Reject oversized bodies in Werkzeug before they are read and parsed
+app.config['MAX_CONTENT_LENGTH'] = 1024 * 1024
 
 product_review_summaries = None
 product_review_summaries_file_path = "./product-review-summaries.json"
@@ -23,6 +26,17 @@ product_review_summaries_file_path = "./product-review-summaries.json"
 inaccurate_product_review_summaries = None
 inaccurate_product_review_summaries_file_path = "./inaccurate-product-review-summaries.json"
 
+def json_response(obj, status=200):
+    """Encode the response body with orjson instead of Flask's stdlib json provider"""
+    return Response(orjson.dumps(obj), status=status, mimetype='application/json')
+
+def parse_request_body():
+    """Decode the JSON request body with orjson, without caching the raw bytes on the request"""
+    try:
+        return orjson.loads(request.get_data(cache=False))
+    except orjson.JSONDecodeError:
+        abort(400, description="Request body must be valid JSON")
+
 def load_product_review_summaries(file_path):
     try:
         with open(file_path, 'r') as file:
@@ -72,12 +86,16 @@ def generate_response(product_id):
 
     return product_review_summary
 
+# Compiled once at import rather than looked up in re's cache on every request
+product_id_pattern = re.compile(r"product ID:([A-Z0-9]+)")
+inaccurate_product_id_pattern = re.compile(r"product ID, but make the answer inaccurate:([A-Z0-9]+)")
+
 def parse_product_id(last_message):
-    match = re.search(r"product ID:([A-Z0-9]+)", last_message)
+    match = product_id_pattern.search(last_message)
     if match:
         return match.group(1).strip()
 
-    match = re.search(r"product ID, but make the answer inaccurate:([A-Z0-9]+)", last_message)
+    match = inaccurate_product_id_pattern.search(last_message)
     if match:
         return match.group(1).strip()
 
@@ -85,7 +103,7 @@ def parse_product_id(last_message):
 
 @app.route('/v1/chat/completions', methods=['POST'])
 def chat_completions():
-    data = request.json
+    data = parse_request_body()
     messages = data.get('messages', [])
     stream = data.get('stream', False)
     model = data.get('model', 'astronomy-llm')
@@ -127,13 +145,15 @@ def chat_completions():
                     "code": "null"
                 }
             }
-            return jsonify(response), 429
+            return json_response(response, 429)
         else:
             # Non-streaming response
+            created = int(time.time())
+            prompt_tokens = count_prompt_tokens(messages)
             response = {
-                "id": f"chatcmpl-mock-{int(time.time())}",
+                "id": f"chatcmpl-mock-{created}",
                 "object": "chat.completion",
-                "created": int(time.time()),
+                "created": created,
                 "model": model,
                 "choices": [{
                     "index": 0,
@@ -152,12 +172,12 @@ def chat_completions():
                     "finish_reason": "tool_calls"
                 }],
                 "usage": {
-                    "prompt_tokens": sum(len(m.get("content", "").split()) for m in messages),
+                    "prompt_tokens": prompt_tokens,
                     "completion_tokens": "0",
-                    "total_tokens": sum(len(m.get("content", "").split()) for m in messages)
+                    "total_tokens": prompt_tokens
                 }
             }
-            return jsonify(response)
+            return json_response(response)
 
     else:
         # Generate the response
@@ -165,13 +185,20 @@ def chat_completions():
 
         return build_response(model, messages, response_text)
 
+def count_prompt_tokens(messages):
+    """Approximate the prompt token count as the number of words across all messages"""
+    return sum(len(m.get("content", "").split()) for m in messages)
+
 def build_response(model, messages, response_text):
     app.logger.info(f"Processing a response: '{response_text}'")
 
+    created = int(time.time())
+    prompt_tokens = count_prompt_tokens(messages)
+    completion_tokens = len(response_text.split())
     response = {
-        "id": f"chatcmpl-mock-{int(time.time())}",
+        "id": f"chatcmpl-mock-{created}",
         "object": "chat.completion",
-        "created": int(time.time()),
+        "created": created,
         "model": model,
         "choices": [{
             "index": 0,
@@ -182,34 +209,40 @@ def build_response(model, messages, response_text):
             "finish_reason": "stop"
         }],
         "usage": {
-            "prompt_tokens": sum(len(m.get("content", "").split()) for m in messages),
-            "completion_tokens": len(response_text.split()),
-            "total_tokens": sum(len(m.get("content", "").split()) for m in messages) + len(response_text.split())
+            "prompt_tokens": prompt_tokens,
+            "completion_tokens": completion_tokens,
+            "total_tokens": prompt_tokens + completion_tokens
         }
     }
-    return jsonify(response)
+    return json_response(response)
+
+# The model list never changes, so serialize it once rather than per request
+models_response_body = orjson.dumps({
+    "object": "list",
+    "data": [
+        {
+            "id": "astronomy-llm",
+            "object": "model",
+            "created": int(time.time()),
+            "owned_by": "astronomy-shop"
+        }
+    ]
+})
 
 @app.route('/v1/models', methods=['GET'])
 def list_models():
     """List available models"""
-    return jsonify({
-        "object": "list",
-        "data": [
-            {
-                "id": "astronomy-llm",
-                "object": "model",
-                "created": int(time.time()),
-                "owned_by": "astronomy-shop"
-            }
-        ]
-    })
+    return Response(models_response_body, mimetype='application/json')
 
 def check_feature_flag(flag_name: str):
     # Initialize OpenFeature
     client = api.get_client()
     return client.get_boolean_value(flag_name, False)
 
-if __name__ == '__main__':
+def init_app():
+    """Configure the flagd provider and load the pre-generated summaries"""
+    global product_review_summaries
+    global inaccurate_product_review_summaries
 
     api.set_provider(FlagdProvider(host=os.environ.get('FLAGD_HOST', 'flagd'), port=os.environ.get('FLAGD_PORT', 8013)))
     product_review_summaries = load_product_review_summaries(product_review_summaries_file_path)
@@ -217,6 +250,10 @@ if __name__ == '__main__':
 
     app.logger.info(product_review_summaries)
 
+if __name__ == '__main__':
+
+    init_app()
+
     print("OpenAI API server starting on http://localhost:8000")
     print("Set your OpenAI base URL to: http://localhost:8000/v1")
-    app.run(host='0.0.0.0', port=8000, debug=True)
+    app.run(host='0.0.0.0', port=8000)
@@ -0,0 +1,12 @@
+# Copyright The OpenTelemetry Authors
+# SPDX-License-Identifier: Apache-2.0
+
+import os
+
+bind = "0.0.0.0:8000"
+
+# A single gevent worker multiplexes many connections; raise WEB_CONCURRENCY
+# (for example to 2 * CPU + 1) when the container memory limit allows it
+workers = int(os.environ.get("WEB_CONCURRENCY", "1"))
+worker_class = "gevent"
+worker_connections = 1000
@@ -0,0 +1,19 @@
+#!/usr/bin/python
+
+# Copyright The OpenTelemetry Authors
+# SPDX-License-Identifier: Apache-2.0
+
+# Patch the standard library before Flask, grpc or requests are imported, so
+# blocking socket I/O yields the greenlet instead of the whole worker
+from gevent import monkey
+if not monkey.is_module_patched('socket'):
+    monkey.patch_all()
+
+# The flagd provider talks to flagd over gRPC, whose C-core would otherwise
+# block the gevent loop
+import grpc.experimental.gevent as grpc_gevent
+grpc_gevent.init_gevent()
+
+from app import app, init_app
+
+init_app()
@@ -3,6 +3,8 @@
 # Copyright The OpenTelemetry Authors
 # SPDX-License-Identifier: Apache-2.0
 
+from functools import lru_cache
+
 def init_metrics(meter):
 
     # Product reviews counter
@@ -21,3 +23,9 @@ def init_metrics(meter):
     }
 
     return product_review_svc_metrics
+
+# Share one attributes dict per product id across metric recordings instead
+# of allocating a new one on every request. Bounded, since ids come from callers.
+@lru_cache(maxsize=1024)
+def product_attributes(product_id):
+    return {'product.id': product_id}
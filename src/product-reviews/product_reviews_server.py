@@ -34,7 +34,8 @@ from openfeature import api
 from openfeature.contrib.provider.flagd import FlagdProvider
 
 from metrics import (
-    init_metrics
+    init_metrics,
+    product_attributes
 )
 
 # OpenAI
@@ -134,7 +135,7 @@ def get_product_reviews(request_product_id):
         span.set_attribute("app.product_reviews.count", len(product_reviews.product_reviews))
 
         # Collect metrics for this service
-        product_review_svc_metrics["app_product_review_counter"].add(len(product_reviews.product_reviews), {'product.id': request_product_id})
+        product_review_svc_metrics["app_product_review_counter"].add(len(product_reviews.product_reviews), product_attributes(request_product_id))
 
         return product_reviews
 
@@ -158,8 +159,7 @@ def get_ai_assistant_response(request_product_id, question):
 
         ai_assistant_response = demo_pb2.AskProductAIAssistantResponse()
 
-        span.set_attribute("app.product.id", request_product_id)
-        span.set_attribute("app.product.question", question)
+        span.set_attributes({"app.product.id": request_product_id, "app.product.question": question})
 
         llm_rate_limit_error = check_feature_flag("llmRateLimitError")
         logger.info(f"llmRateLimitError feature flag: {llm_rate_limit_error}")
@@ -305,7 +305,7 @@ def get_ai_assistant_response(request_product_id, question):
             ai_assistant_response.response = response_message.content
 
         # Collect metrics for this service
-        product_review_svc_metrics["app_ai_assistant_counter"].add(1, {'product.id': request_product_id})
+        product_review_svc_metrics["app_ai_assistant_counter"].add(1, product_attributes(request_product_id))
 
         return ai_assistant_response
 
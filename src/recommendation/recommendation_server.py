@@ -39,6 +39,9 @@ from metrics import (
 cached_ids = []
 first_run = True
 
+# Attributes for the recommendations counter never vary, so share one dict
+catalog_recommendation_attributes = {'recommendation.type': 'catalog'}
+
 class RecommendationService(demo_pb2_grpc.RecommendationServiceServicer):
     def ListRecommendations(self, request, context):
         prod_list = get_product_list(request.product_ids)
@@ -51,7 +54,7 @@ class RecommendationService(demo_pb2_grpc.RecommendationServiceServicer):
         response.product_ids.extend(prod_list)
 
         # Collect metrics for this service
-        rec_svc_metrics["app_recommendations_counter"].add(len(prod_list), {'recommendation.type': 'catalog'})
+        rec_svc_metrics["app_recommendations_counter"].add(len(prod_list), catalog_recommendation_attributes)
 
         return response
 
@@ -76,10 +79,9 @@ def get_product_list(request_product_ids):
 
         # Feature flag scenario - Cache Leak
         if check_feature_flag("recommendationCacheFailure"):
-            span.set_attribute("app.recommendation.cache_enabled", True)
             if random.random() < 0.5 or first_run:
                 first_run = False
-                span.set_attribute("app.cache_hit", False)
+                span.set_attributes({"app.recommendation.cache_enabled": True, "app.cache_hit": False})
                 logger.info("get_product_list: cache miss")
                 cat_response = product_catalog_stub.GetProduct(demo_pb2.Empty())
                 response_ids = [x.id for x in cat_response.products]
@@ -87,7 +89,7 @@ def get_product_list(request_product_ids):
                 cached_ids = cached_ids + cached_ids[:len(cached_ids) // 4]
                 product_ids = cached_ids
             else:
-                span.set_attribute("app.cache_hit", True)
+                span.set_attributes({"app.recommendation.cache_enabled": True, "app.cache_hit": True})
                 logger.info("get_product_list: cache hit")
                 product_ids = cached_ids
         else:
@@ -95,12 +97,9 @@ def get_product_list(request_product_ids):
             cat_response = product_catalog_stub.ListProducts(demo_pb2.Empty())
             product_ids = [x.id for x in cat_response.products]
 
-        span.set_attribute("app.products.count", len(product_ids))
-
         # Create a filtered list of products excluding the products received as input
         filtered_products = list(set(product_ids) - set(request_product_ids))
         num_products = len(filtered_products)
-        span.set_attribute("app.filtered_products.count", num_products)
         num_return = min(max_responses, num_products)
 
         # Sample list of indicies to return
@@ -108,7 +107,12 @@ def get_product_list(request_product_ids):
         # Fetch product ids from indices
         prod_list = [filtered_products[i] for i in indices]
 
-        span.set_attribute("app.filtered_products.list", prod_list)
+        if span.is_recording():
+            span.set_attributes({
+                "app.products.count": len(product_ids),
+                "app.filtered_products.count": num_products,
+                "app.filtered_products.list": prod_list,
+            })
 
         return prod_list
 